@@ -0,0 +1,57 @@
+"""Measure import and startup cost of short-lived invocations.
+
+Each scenario is run in a fresh interpreter, so the numbers include interpreter
+startup. The ``python -c pass`` baseline shows how much of that is ours.
+
+    python benchmarks/startup.py [-n RUNS]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "baseline (python -c pass)": "pass",
+    "import proxyseller": "import proxyseller",
+    "construct ProxySellerAPI": "from proxyseller import ProxySellerAPI; ProxySellerAPI(api_key='x')",
+    "construct + check lazy imports": (
+        "import sys; from proxyseller import ProxySellerAPI; ProxySellerAPI(api_key='x'); "
+        "heavy = {'requests', 'json', 'hashlib', 'tempfile', 're', 'concurrent.futures'} & set(sys.modules); "
+        "assert not heavy, f'imported at startup: {heavy}'"
+    ),
+}
+
+
+def run(code, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--runs", type=int, default=20, help="runs per scenario (default: 20)")
+    args = parser.parse_args()
+
+    baseline = None
+    print(f"{'scenario':<34} {'median ms':>10} {'min ms':>8} {'overhead ms':>12}")
+    for name, code in SCENARIOS.items():
+        timings = run(code, args.runs)
+        median = statistics.median(timings)
+        if baseline is None:
+            baseline = median
+        print(f"{name:<34} {median:>10.1f} {min(timings):>8.1f} {median - baseline:>12.1f}")
+
+    print("\nFor a per-module breakdown run:")
+    print(f"  {os.path.basename(sys.executable)} -X importtime -c \"import proxyseller.api\"")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+"""ProxySeller API Manager.
+
+``ProxySellerAPI`` is loaded on first access, so ``import proxyseller`` is close
+to free for short-lived processes that only need part of the package.
+"""
+
+__all__ = ["ProxySellerAPI"]
+
+
+def __getattr__(name):
+    if name == "ProxySellerAPI":
+        from .api import ProxySellerAPI
+        return ProxySellerAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
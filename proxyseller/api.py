@@ -0,0 +1,1108 @@
+"""ProxySeller resident proxy API client.
+
+``requests`` and the heavier stdlib modules (``json``, ``hashlib``, ``re``,
+``concurrent.futures``) are imported inside the methods that need them, so importing this module and constructing ``ProxySellerAPI``
+stays cheap and never touches the network.
+"""
+import time
+import os
+
+API_KEY_ENV = "PROXYSELLER_API_KEY"
+API_KEY_FILE = "api_key.txt"
+TMP_PREFIX = ".tmp_"
+
+
+class _NoPhase:
+    """Stand-in for a profiler phase when profiling is off"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+class ProxySellerAPI:
+    def __init__(self, api_key=None, api_key_file=API_KEY_FILE, interactive=False, profiler=None):
+        """Create a client without blocking on credentials.
+
+        The API key is taken from ``api_key``, then the ``PROXYSELLER_API_KEY``
+        environment variable, then ``api_key_file``. It is resolved on first use;
+        the user is only prompted for it when ``interactive`` is true.
+        An optional ``proxyseller.profiling.Profiler`` receives per-phase timings.
+        """
+        self._api_key = api_key or os.environ.get(API_KEY_ENV) or None
+        self.api_key_file = api_key_file
+        self.interactive = interactive
+        self.profiler = profiler
+        self.output_file = "proxy_list.txt"
+        self.previous_countries_file = "previous_countries.json"
+        self.sync_dir = "synced_proxies"
+        self.sync_state_file = "sync_state.json"
+
+    @property
+    def api_key(self):
+        return self.resolve_api_key()
+
+    def resolve_api_key(self):
+        """Resolve the API key now instead of on first use, prompting if interactive"""
+        if self._api_key is None:
+            self._api_key = self.load_api_key()
+        return self._api_key
+
+    @property
+    def base_url(self):
+        return f'https://proxy-seller.com/personal/api/v1/{self.api_key}/resident'
+
+    def load_api_key(self):
+        # Try to load API key from file
+        try:
+            if self.api_key_file and os.path.exists(self.api_key_file):
+                with open(self.api_key_file, "r") as file:
+                    api_key = file.read().strip()
+                    if api_key:
+                        return api_key
+        except:
+            pass
+
+        if not self.interactive:
+            raise RuntimeError(f"API-ключ не задан: передайте api_key, установите {API_KEY_ENV} "
+                               f"или создайте файл '{self.api_key_file}'.")
+
+        # If file doesn't exist or there was an error, ask the user
+        api_key = input("Введите ваш API-ключ для ProxySeller: ")
+
+        # Save the API key for future use
+        if self.api_key_file:
+            with open(self.api_key_file, "w") as file:
+                file.write(api_key)
+
+        return api_key
+
+    def _phase(self, name):
+        """Timer for a profiling phase (fetch, parse, format, write); a no-op without a profiler"""
+        if self.profiler is None:
+            return _NO_PHASE
+        return self.profiler.phase(name)
+
+    def get_lists(self):
+        """Get all existing IP lists"""
+        return self._fetch_lists() or []
+
+    def _fetch_lists(self):
+        """Fetch IP lists, returning None if the request failed"""
+        import requests
+
+        url = f'{self.base_url}/lists'
+
+        try:
+            with self._phase("fetch"):
+                response = requests.get(url)
+
+            if response.status_code == 200:
+                with self._phase("parse"):
+                    data = response.json()
+
+                if data.get("status") == "success":
+                    # Based on the debug output, data itself contains the lists
+                    if isinstance(data.get("data"), list):
+                        return data["data"]
+                    # Or it might be nested under 'items' as in the documentation
+                    elif isinstance(data.get("data"), dict) and "items" in data["data"]:
+                        return data["data"]["items"]
+                    else:
+                        print("Ошибка: Неожиданная структура данных в ответе.")
+                        print("Структура ответа:", data)
+                else:
+                    print("Ошибка: Некорректный формат ответа сервера.")
+                    if "errors" in data and data["errors"]:
+                        print("Сообщение об ошибке:", data["errors"])
+            else:
+                print(f'Ошибка при получении списка. Код ошибки: {response.status_code}')
+                print('Ответ сервера:', response.text)
+        except Exception as e:
+            print(f"Произошла ошибка: {str(e)}")
+
+        return None
+
+    @staticmethod
+    def _list_countries(item):
+        """Extract country codes from a list's geo information"""
+        countries = []
+        if 'geo' in item:
+            geo_info = item['geo']
+            # Check if geo is a list of country objects
+            if isinstance(geo_info, list):
+                for geo in geo_info:
+                    if isinstance(geo, dict) and 'country' in geo:
+                        countries.append(geo['country'])
+            # Or if it's a single country object
+            elif isinstance(geo_info, dict) and 'country' in geo_info:
+                countries.append(geo_info['country'])
+        return countries
+
+    @staticmethod
+    def _safe_title(title):
+        """Make a list title safe for use in a filename"""
+        return ''.join(c for c in title if c.isalnum() or c in ' _-').replace(' ', '_')
+
+    def display_lists(self, lists):
+        """Display lists in a simple, comfortable format"""
+        if not lists:
+            print("Списков прокси не найдено или произошла ошибка при их получении.")
+            return
+
+        print("\n=== Доступные списки прокси ===")
+
+        for i, item in enumerate(lists, 1):
+            try:
+                list_id = item.get('id', 'N/A')
+                title = item.get('title', 'Без названия')
+
+                # Handle geo information - showing all countries
+                countries = self._list_countries(item)
+
+                # Format the countries list
+                countries_str = ", ".join(countries) if countries else 'N/A'
+
+                print(f"{i}. ID: {list_id} - {title} - Страны: {countries_str}")
+            except Exception as e:
+                print(f"Ошибка при отображении элемента списка: {str(e)}")
+                # Print item structure for debugging
+                print(f"Структура элемента: {type(item)}")
+                if isinstance(item, dict):
+                    print(f"Ключи элемента: {item.keys()}")
+
+        print("=" * 30)
+
+        # Return the lists for use in other functions
+        return lists
+
+    def select_lists(self, available_lists, prompt):
+        """Ask for list numbers (comma-separated or a [start, end] range) and validate them"""
+        print("\nВы можете выбрать списки следующими способами:")
+        print("1. Отдельные номера через запятую (например: 1,3,5)")
+        print("2. Диапазон в квадратных скобках (например: [10, 20])")
+        selection_input = input(f"\n{prompt}")
+
+        selections = []
+
+        # Check if it's a range in square brackets
+        if selection_input.strip().startswith('[') and selection_input.strip().endswith(']'):
+            # Extract the range
+            range_content = selection_input.strip()[1:-1]  # Remove the brackets
+            range_parts = [part.strip() for part in range_content.split(',')]
+
+            if len(range_parts) == 2 and range_parts[0].isdigit() and range_parts[1].isdigit():
+                start = int(range_parts[0])
+                end = int(range_parts[1])
+
+                # Create a list of all numbers in the range (inclusive)
+                selections = list(range(start, end + 1))
+            else:
+                print("Ошибка: Неверный формат диапазона. Ожидается [start, end].")
+                return []
+        else:
+            # Process as comma-separated list
+            selections = [int(x.strip()) for x in selection_input.split(',') if x.strip().isdigit()]
+
+        # Validate selections
+        valid_selections = []
+        for selection in selections:
+            if 1 <= selection <= len(available_lists):
+                valid_selections.append(selection)
+            else:
+                print(f"Предупреждение: Номер {selection} вне диапазона и будет пропущен.")
+
+        if not valid_selections:
+            print("Ошибка: Не выбрано ни одного действительного списка.")
+
+        return valid_selections
+
+    def download_proxies(self):
+        """Download proxies from existing lists with support for range selection"""
+        import json
+        import requests
+
+        # First, get all lists
+        lists = self.get_lists()
+        available_lists = self.display_lists(lists)
+
+        if not available_lists:
+            return
+
+        # Ask for list selection
+        try:
+            valid_selections = self.select_lists(available_lists, "Выберите номера списков для скачивания прокси: ")
+            if not valid_selections:
+                return
+
+            # Choose proxy format
+            print("\nВыберите формат прокси:")
+            print("1. login:password@host:port (default)")
+            print("2. login:password:host:port")
+            print("3. host:port:login:password")
+            print("4. host:port@login:password")
+
+            format_choice = input("Выберите формат [1]: ") or "1"
+            proxy_format = int(format_choice) if format_choice.isdigit() and 1 <= int(format_choice) <= 4 else 1
+
+            # Choose export format
+            print("\nВыберите формат экспорта:")
+            print("1. txt (default)")
+            print("2. csv")
+            print("3. json")
+
+            export_format = input("Выберите формат [1]: ") or "1"
+            if export_format == "1":
+                file_ext = "txt"
+                export_type = "txt"
+            elif export_format == "2":
+                file_ext = "csv"
+                export_type = "csv"
+            elif export_format == "3":
+                file_ext = "json"
+                export_type = "json"
+            else:
+                file_ext = "txt"
+                export_type = "txt"
+
+            # Changed default to 'y' for merging files
+            merge_files = input("\nОбъединить все прокси в один файл? (y/n, по умолчанию: y): ").lower() != 'n'
+
+            # Process each selected list
+            all_proxies = []
+            selected_list_names = []
+            successful_downloads = 0
+
+            for selection in valid_selections:
+                # Get the selected list
+                selected_list = available_lists[selection - 1]
+                list_id = selected_list.get('id')
+                list_title = selected_list.get('title', f'proxies_{list_id}')
+
+                # Get country information for filename
+                countries = self._list_countries(selected_list)
+
+                countries_str = "_".join(countries) if countries else 'no_country'
+
+                # Make API request to download proxies
+                url = f'https://proxy-seller.com/personal/api/v1/{self.api_key}/proxy/download/resident'
+
+                # Add listId parameter
+                params = {
+                    'format': export_type,
+                    'listId': list_id
+                }
+
+                print(f"\nЗагрузка прокси из списка '{list_title}'...")
+
+                try:
+                    with self._phase("fetch"):
+                        response = requests.get(url, params=params)
+
+                    if response.status_code == 200:
+                        # Create a better filename based on list title and countries
+                        safe_title = self._safe_title(list_title)
+                        filename = f"{safe_title}_{countries_str}.{file_ext}"
+
+                        # Keep track of list names for merged filename
+                        selected_list_names.append(safe_title)
+
+                        # Process the response based on the format
+                        with self._phase("parse"):
+                            content = response.text
+                        formatted_content = ""
+
+                        # If user requested a specific format and we got raw data, convert it
+                        if proxy_format != 1 and export_type == "txt":
+                            # Assume one line per proxy in login:password@host:port format
+                            with self._phase("parse"):
+                                parsed_lines = []
+                                for line in content.splitlines():
+                                    try:
+                                        # Parse the line
+                                        auth, host_port = line.split('@', 1)
+                                        login, password = auth.split(':', 1)
+                                        host, port = host_port.split(':', 1)
+                                        parsed_lines.append((line, (login, password, host, port)))
+                                    except:
+                                        # If parsing fails, keep the original line
+                                        parsed_lines.append((line, None))
+
+                            with self._phase("format"):
+                                formatted_lines = []
+                                for line, parts in parsed_lines:
+                                    if parts is None:
+                                        formatted_lines.append(line)
+                                        continue
+
+                                    login, password, host, port = parts
+
+                                    # Reformat according to user's choice
+                                    if proxy_format == 2:
+                                        # login:password:host:port
+                                        formatted = f"{login}:{password}:{host}:{port}"
+                                    elif proxy_format == 3:
+                                        # host:port:login:password
+                                        formatted = f"{host}:{port}:{login}:{password}"
+                                    elif proxy_format == 4:
+                                        # host:port@login:password
+                                        formatted = f"{host}:{port}@{login}:{password}"
+                                    else:
+                                        # Default format (shouldn't happen here)
+                                        formatted = line
+
+                                    formatted_lines.append(formatted)
+
+                                # Join all formatted lines
+                                formatted_content = "\n".join(formatted_lines)
+                        else:
+                            # Use the content as is
+                            formatted_content = content
+
+                        # If we're merging files, add to the list
+                        if merge_files:
+                            all_proxies.append(formatted_content)
+                        else:
+                            # Save to individual file
+                            if export_type in ["txt", "csv"]:
+                                with self._phase("write"), open(filename, "w") as file:
+                                    file.write(formatted_content)
+                            elif export_type == "json":
+                                try:
+                                    with self._phase("parse"):
+                                        json_data = response.json()
+                                    with self._phase("write"), open(filename, "w") as file:
+                                        json.dump(json_data, file, indent=4)
+                                except Exception as e:
+                                    print(f"Ошибка при обработке JSON для списка '{list_title}': {str(e)}")
+                                    # Save raw content as fallback
+                                    with self._phase("write"), open(filename, "w") as file:
+                                        file.write(formatted_content)
+
+                            print(f"Прокси успешно загружены и сохранены в файл '{filename}'.")
+
+                        successful_downloads += 1
+                    else:
+                        print(
+                            f'Ошибка при загрузке прокси из списка "{list_title}". Код ошибки: {response.status_code}')
+                        print('Ответ сервера:', response.text)
+                except Exception as e:
+                    print(f"Произошла ошибка при загрузке прокси из списка '{list_title}': {str(e)}")
+
+            # If we're merging files, save all proxies to one file
+            if merge_files and all_proxies:
+                # Create a filename based on selected list names
+                if len(selected_list_names) <= 3:
+                    # If 3 or fewer lists, include all names in the filename
+                    lists_part = "_".join(selected_list_names)
+                else:
+                    # If more than 3 lists, use the first list name and a count
+                    lists_part = f"{selected_list_names[0]}_and_{len(selected_list_names) - 1}_more"
+
+                merged_filename = f"{lists_part}.{file_ext}"
+
+                try:
+                    with self._phase("write"), open(merged_filename, "w") as file:
+                        file.write("\n".join(all_proxies))
+
+                    print(f"\nВсе прокси успешно объединены и сохранены в файл '{merged_filename}'.")
+                except Exception as e:
+                    print(f"Ошибка при сохранении объединенного файла: {str(e)}")
+
+            print(f"\nУспешно обработано {successful_downloads} из {len(valid_selections)} выбранных списков.")
+
+        except ValueError:
+            print("Ошибка: Введите числовое значение.")
+        except Exception as e:
+            print(f"Произошла ошибка: {str(e)}")
+
+    def load_previous_countries(self):
+        """Load previously used countries from a file"""
+        import json
+
+        if os.path.exists(self.previous_countries_file):
+            try:
+                with open(self.previous_countries_file, "r") as file:
+                    return json.load(file)
+            except Exception as e:
+                print(f"Ошибка при загрузке предыдущих стран: {str(e)}")
+        return {}
+
+    def save_previous_countries(self, country, region="", city="", isp=""):
+        """Save used countries to a file"""
+        import json
+
+        countries_data = self.load_previous_countries()
+
+        countries_data[country] = {
+            "region": region,
+            "city": city,
+            "isp": isp,
+            "last_used": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+        try:
+            with open(self.previous_countries_file, "w") as file:
+                json.dump(countries_data, file, indent=4)
+        except Exception as e:
+            print(f"Ошибка при сохранении предыдущих стран: {str(e)}")
+
+    def create_lists(self):
+        """Create one or multiple new IP lists with country presets"""
+        import requests
+
+        # Define country presets
+        country_presets = {
+            "1": {"name": "Worldwide", "countries": ""},
+            "2": {"name": "Europe",
+                  "countries": "AT,AL,AD,BY,BE,BG,BA,GB,HU,DE,GR,GE,DK,IE,ES,IT,IS,LV,LT,LI,LU,MK,MT,MD,NO,PL,PT,RU,RO,SM,RS,SK,SI,UA,FI,FR,HR,ME,CZ,CH,SE,EE"},
+            "3": {"name": "Asia",
+                  "countries": "AZ,AM,AF,BD,BH,VN,IL,IN,ID,JO,IQ,IR,YE,KZ,KH,QA,CY,KG,CN,KP,KR,KW,LA,LB,MY,MV,MN,MM,NP,AE,OM,PK,PS,SA,SY,TJ,TH,TM,TR,UZ,PH,LK,JP"},
+            "4": {"name": "South America", "countries": "AR,BO,BR,VE,GY,CO,PY,PE,SR,UY,CL,EC"},
+            "5": {"name": "North America",
+                  "countries": "AG,BS,BB,BZ,HT,GT,HN,GD,DM,DO,CA,CR,CU,MX,NI,PA,SV,VC,KN,LC,US,TT,JM"},
+            "6": {"name": "Africa",
+                  "countries": "DZ,AO,BJ,BW,BI,BF,GA,GM,GH,GN,GW,DJ,EG,ZM,CV,CM,KE,KM,CI,LS,LR,LY,MU,MR,MW,ML,MA,MZ,NA,NE,NG,RW,ST,SC,SN,SO,SD,SL,TZ,TG,TN,UG,CF,TD,PG,GQ,ER,ET,ZA,SS"}
+        }
+
+        print("\n=== Создание нового списка прокси ===")
+        title = input("Введите название списка: ")
+
+        # Ask how many lists to create
+        try:
+            num_lists = int(input("Сколько списков вы хотите создать (для получения более 1000 прокси)? [1]: ") or "1")
+            if num_lists < 1:
+                num_lists = 1
+                print("Количество списков должно быть как минимум 1.")
+        except ValueError:
+            num_lists = 1
+            print("Ошибка ввода. Установлено значение по умолчанию: 1 список.")
+
+        # Display country presets
+        print("\nПредустановленные паки стран:")
+        for key, preset in country_presets.items():
+            print(f"{key}. {preset['name']}")
+        print("0. Ручной ввод стран")
+
+        # Select country preset or manual input
+        preset_choice = input("\nВыберите пак или 0 для ручного ввода: ")
+
+        if preset_choice in country_presets:
+            country = country_presets[preset_choice]['countries']
+            print(f"Выбран пак: {country_presets[preset_choice]['name']}")
+        elif preset_choice == "0":
+            country = input("Введите код или коды нескольких стран через запятую (https://www.iban.com/country-codes - коды стран): ").upper().replace(" ", "")
+        else:
+            print("Неверный выбор. Будет использован ручной ввод.")
+            country = input("Введите код или коды нескольких стран через запятую (https://www.iban.com/country-codes - коды стран):: ").upper().replace(" ", "")
+
+        # Rest of the method remains the same as in the original implementation
+        region = input("Введите регион (или оставьте пустым): ")
+        city = input("Введите город (или оставьте пустым): ")
+        isp = input("Введите провайдера (или оставьте пустым): ")
+
+        # Save the country for future use
+        self.save_previous_countries(country, region, city, isp)
+
+        # Получаем информацию о портах
+        try:
+            num_ports = int(input("Введите количество портов на список (максимум и по умолчанию 1000): ") or "1000")
+            if num_ports > 1000:
+                num_ports = 1000
+                print("Максимальное количество портов ограничено до 1000.")
+        except ValueError:
+            num_ports = 1000
+            print("Ошибка ввода. Установлено значение по умолчанию: 1000 портов.")
+
+        # Получаем IP для белого списка
+        whitelist = input("Введите IP-адреса для белого списка через запятую (или оставьте пустым): ")
+
+        # Choose proxy format
+        print("\nВыберите формат прокси:")
+        print("1. login:password@host:port (default)")
+        print("2. login:password:host:port")
+        print("3. host:port:login:password")
+        print("4. host:port@login:password")
+
+        format_choice = input("Выберите формат [1]: ") or "1"
+        proxy_format = int(format_choice) if format_choice.isdigit() and 1 <= int(format_choice) <= 4 else 1
+
+        # Create lists
+        total_proxies = 0
+        all_proxy_lists = []
+
+        for i in range(num_lists):
+            list_title = title
+            if num_lists > 1:
+                list_title = f"{title} #{i + 1}"
+
+            data = {
+                'title': list_title,
+                'whitelist': whitelist,
+                'geo': {
+                    'country': country,
+                    'region': region,
+                    'city': city,
+                    'isp': isp
+                },
+                'ports': num_ports,
+                'export': {
+                    'ports': 10000,  # Начальный порт
+                    'ext': 'txt'  # Формат экспорта
+                }
+            }
+
+            try:
+                with self._phase("fetch"):
+                    response = requests.post(f'{self.base_url}/list/add', json=data)
+
+                if response.status_code == 200:
+                    with self._phase("parse"):
+                        response_data = response.json()
+
+                    if response_data.get("status") == "success" and "data" in response_data:
+                        proxy_data = response_data["data"]
+                        print(f"\n=== Список прокси '{list_title}' успешно создан ===")
+                        print(f"Название: {proxy_data.get('title', 'N/A')}")
+
+                        # Generate proxy list
+                        with self._phase("format"):
+                            proxy_list = self.generate_proxy_list(proxy_data, num_ports, proxy_format)
+                        all_proxy_lists.extend(proxy_list)
+                        total_proxies += len(proxy_list)
+                    else:
+                        print("Ошибка: Некорректный формат ответа сервера.")
+                        if "errors" in response_data and response_data["errors"]:
+                            print("Сообщение об ошибке:", response_data["errors"])
+                else:
+                    print(f'Ошибка при создании списка. Код ошибки: {response.status_code}')
+                    print('Ответ сервера:', response.text)
+            except Exception as e:
+                print(f"Произошла ошибка: {str(e)}")
+
+        # Save all proxy lists to a single file
+        if all_proxy_lists:
+            # Create a safe filename
+            safe_title = self._safe_title(title)
+            filename = f"{safe_title}_proxies.txt"
+
+            # Save to file
+            with self._phase("write"), open(filename, "w") as file:
+                file.write("\n".join(all_proxy_lists))
+
+            print(f"\nВсего создано {total_proxies} прокси в {num_lists} списках.")
+            print(f"Прокси сохранены в файл '{filename}'.")
+
+        return total_proxies
+
+    def generate_proxy_list(self, proxy_data, num_ports, format_type=1):
+        """Generate proxy list in the specified format"""
+        try:
+            login = proxy_data.get("login")
+            password = proxy_data.get("password")
+            base_host = "res.proxy-seller.com"
+            base_port = int(proxy_data.get("export", {}).get("ports", 10000))
+
+            if login and password:
+                # Generate proxy list in the specified format
+                proxy_list = []
+
+                for port in range(base_port, base_port + num_ports):
+                    if format_type == 1:
+                        # login:password@host:port
+                        proxy = f"{login}:{password}@{base_host}:{port}"
+                    elif format_type == 2:
+                        # login:password:host:port
+                        proxy = f"{login}:{password}:{base_host}:{port}"
+                    elif format_type == 3:
+                        # host:port:login:password
+                        proxy = f"{base_host}:{port}:{login}:{password}"
+                    elif format_type == 4:
+                        # host:port@login:password
+                        proxy = f"{base_host}:{port}@{login}:{password}"
+                    else:
+                        # Default format
+                        proxy = f"{login}:{password}@{base_host}:{port}"
+
+                    proxy_list.append(proxy)
+
+                return proxy_list
+            else:
+                print("Ошибка: Не удалось получить логин и пароль из ответа сервера.")
+        except Exception as e:
+            print(f"Ошибка при генерации списка прокси: {str(e)}")
+
+        return []
+
+    def rename_list(self):
+        """Rename an existing IP list"""
+        # First, get all lists
+        lists = self.get_lists()
+        available_lists = self.display_lists(lists)
+
+        if not available_lists:
+            return
+
+        # Ask for list selection
+        try:
+            selection = int(input("\nВыберите номер списка для переименования: "))
+
+            if selection < 1 or selection > len(available_lists):
+                print(f"Ошибка: выбран неверный номер списка.")
+                return
+
+            # Get the selected list
+            selected_list = available_lists[selection - 1]
+            list_id = selected_list.get('id')
+
+            # Ask for new name
+            new_title = input("Введите новое название для списка: ")
+
+            # Make API request
+            success, error = self._rename_request(list_id, new_title)
+
+            if success:
+                selected_list['title'] = new_title
+                print(f"Список успешно переименован в '{new_title}'.")
+            else:
+                print(error)
+        except ValueError:
+            print("Ошибка: Введите числовое значение.")
+        except Exception as e:
+            print(f"Произошла ошибка: {str(e)}")
+
+    def _rename_request(self, list_id, new_title):
+        """Send a single /list/rename request, returning (success, error message)"""
+        import requests
+
+        url = f'{self.base_url}/list/rename'
+        data = {
+            'id': list_id,
+            'title': new_title
+        }
+
+        try:
+            with self._phase("fetch"):
+                response = requests.post(url, json=data)
+
+            if response.status_code == 200:
+                response_data = response.json()
+
+                if response_data.get("status") == "success":
+                    return True, ""
+
+                error = "Ошибка: Некорректный формат ответа сервера."
+                if "errors" in response_data and response_data["errors"]:
+                    error += f" Сообщение об ошибке: {response_data['errors']}"
+                return False, error
+
+            return False, (f'Ошибка при переименовании списка. Код ошибки: {response.status_code}. '
+                           f'Ответ сервера: {response.text}')
+        except Exception as e:
+            return False, f"Произошла ошибка: {str(e)}"
+
+    def render_title(self, item, index, template=None, pattern=None, replacement=""):
+        """Build a new list title from a template or a regex substitution.
+
+        Template fields: {title}, {id}, {country} and {index} (1-based position in the selection).
+        """
+        import re
+
+        title = item.get('title', '')
+        if pattern is not None:
+            # An empty pattern matches between every character
+            if not pattern:
+                raise ValueError("пустое регулярное выражение")
+            title = re.sub(pattern, replacement, title)
+        if template:
+            countries = self._list_countries(item)
+            title = template.format(
+                title=title,
+                id=item.get('id', ''),
+                country="_".join(countries) if countries else 'no_country',
+                index=index
+            )
+        return title
+
+    def bulk_rename(self, lists, template=None, pattern=None, replacement="", max_workers=8):
+        """Rename many lists concurrently with at most max_workers requests in flight.
+
+        Lists are de-duplicated by id, so a list is renamed at most once. Successfully
+        renamed items in ``lists`` are updated in place. Returns one result dict per
+        unique list: id, old_title, new_title, success and error.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        unique_lists = []
+        seen_ids = set()
+        for item in lists:
+            if item.get('id') not in seen_ids:
+                seen_ids.add(item.get('id'))
+                unique_lists.append(item)
+
+        results = []
+        pending = []
+        for index, item in enumerate(unique_lists, 1):
+            old_title = item.get('title', '')
+            result = {"id": item.get('id'), "old_title": old_title, "new_title": old_title,
+                      "success": True, "error": ""}
+            results.append(result)
+            try:
+                result["new_title"] = self.render_title(item, index, template, pattern, replacement)
+            except Exception as e:
+                result.update(success=False, error=f"Ошибка в шаблоне названия: {str(e)}")
+                continue
+            if not result["new_title"].strip():
+                result.update(success=False, error="Ошибка: новое название получилось пустым.")
+                continue
+            if result["new_title"] != old_title:
+                pending.append((item, result))
+
+        def rename(job):
+            item, result = job
+            success, error = self._rename_request(item.get('id'), result["new_title"])
+            result.update(success=success, error=error)
+            return item, result
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+                for item, result in executor.map(rename, pending):
+                    if result["success"]:
+                        item['title'] = result["new_title"]
+
+        return results
+
+    def bulk_rename_lists(self):
+        """Rename multiple IP lists using a title template or a regex substitution"""
+        import re
+
+        lists = self.get_lists()
+        available_lists = self.display_lists(lists)
+
+        if not available_lists:
+            return
+
+        try:
+            valid_selections = self.select_lists(available_lists, "Выберите номера списков для переименования: ")
+            if not valid_selections:
+                return
+
+            print("\nВыберите способ переименования:")
+            print("1. Шаблон (поля: {title}, {id}, {country}, {index}), например: {title}-{country}-{index}")
+            print("2. Замена по регулярному выражению")
+            mode = input("Выберите способ [1]: ") or "1"
+
+            template = pattern = None
+            replacement = ""
+            if mode == "2":
+                pattern = input("Введите регулярное выражение: ")
+                if not pattern:
+                    print("Ошибка: Регулярное выражение не может быть пустым.")
+                    return
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    print(f"Ошибка: Неверное регулярное выражение: {str(e)}")
+                    return
+                replacement = input("Введите строку замены (\\1 - первая группа): ")
+            else:
+                template = input("Введите шаблон названия: ")
+                if not template.strip():
+                    print("Ошибка: Шаблон названия не может быть пустым.")
+                    return
+
+            try:
+                max_workers = int(input("Количество параллельных запросов [8]: ") or "8")
+            except ValueError:
+                max_workers = 8
+                print("Ошибка ввода. Установлено значение по умолчанию: 8 запросов.")
+
+            # The same list selected twice would get two titles and two racing requests,
+            # bulk_rename() additionally de-duplicates by list id
+            selected_lists = [available_lists[selection - 1] for selection in dict.fromkeys(valid_selections)]
+            results = self.bulk_rename(selected_lists, template, pattern, replacement, max_workers)
+
+            print("\nРезультаты переименования:")
+            renamed_count = 0
+            for result in results:
+                if not result["success"]:
+                    print(f"- ОШИБКА {result['old_title']} (ID: {result['id']}): {result['error']}")
+                elif result["new_title"] == result["old_title"]:
+                    print(f"- без изменений: {result['old_title']} (ID: {result['id']})")
+                else:
+                    renamed_count += 1
+                    print(f"- {result['old_title']} -> {result['new_title']} (ID: {result['id']})")
+
+            print(f"\nПереименовано {renamed_count} из {len(results)} выбранных списков.")
+
+        except Exception as e:
+            print(f"Произошла ошибка: {str(e)}")
+
+    def delete_list(self):
+        """Delete multiple existing IP lists with support for range selection"""
+        import requests
+
+        # First, get all lists
+        lists = self.get_lists()
+        available_lists = self.display_lists(lists)
+
+        if not available_lists:
+            return
+
+        # Ask for list selection
+        try:
+            valid_selections = self.select_lists(available_lists, "Выберите номера списков для удаления: ")
+            if not valid_selections:
+                return
+
+            # Show selected lists
+            print("\nВыбранные списки для удаления:")
+            selected_lists = []
+            for selection in valid_selections:
+                selected_list = available_lists[selection - 1]
+                list_id = selected_list.get('id')
+                title = selected_list.get('title', 'Без названия')
+                print(f"- {title} (ID: {list_id})")
+                selected_lists.append((list_id, title))
+
+            # Confirm deletion
+            confirm = input(f"\nВы уверены, что хотите удалить {len(selected_lists)} выбранных списков? (y/n): ")
+            if confirm.lower() != 'y':
+                print("Операция отменена.")
+                return
+
+            # Delete each list
+            deleted_count = 0
+            for list_id, title in selected_lists:
+                # Make API request
+                url = f'{self.base_url}/list/delete'
+                data = {
+                    'id': list_id
+                }
+
+                try:
+                    response = requests.delete(url, json=data)
+
+                    if response.status_code == 200:
+                        response_data = response.json()
+
+                        if response_data.get("status") == "success":
+                            print(f"Список '{title}' успешно удален.")
+                            deleted_count += 1
+                        else:
+                            print(f"Ошибка при удалении списка '{title}'.")
+                            if "errors" in response_data and response_data["errors"]:
+                                print("Сообщение об ошибке:", response_data["errors"])
+                    else:
+                        print(f'Ошибка при удалении списка "{title}". Код ошибки: {response.status_code}')
+                        print('Ответ сервера:', response.text)
+                except Exception as e:
+                    print(f"Произошла ошибка при удалении списка '{title}': {str(e)}")
+
+            print(f"\nУдалено {deleted_count} из {len(selected_lists)} выбранных списков.")
+
+        except ValueError:
+            print("Ошибка: Неверный формат ввода.")
+        except Exception as e:
+            print(f"Произошла ошибка: {str(e)}")
+
+    def _atomic_write(self, filename, content):
+        """Write a file via a temporary file and rename, so readers never see partial data"""
+        directory = os.path.dirname(filename) or "."
+
+        # Created with 0666 like open() does, so the umask applies without touching it
+        while True:
+            tmp_path = os.path.join(directory, f"{TMP_PREFIX}{os.urandom(6).hex()}_{os.path.basename(filename)}")
+            try:
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                break
+            except FileExistsError:
+                continue
+
+        replaced = False
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(content)
+                file.flush()
+                os.fsync(file.fileno())
+            # Keep the mode of the file being replaced
+            if os.path.exists(filename):
+                os.chmod(tmp_path, os.stat(filename).st_mode & 0o777)
+            os.replace(tmp_path, filename)
+            replaced = True
+        finally:
+            # Also runs on KeyboardInterrupt, so stopping the daemon leaves no temp files
+            if not replaced and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _remove_stale_tmp_files(self):
+        """Remove temp files left in sync_dir by an interrupted write"""
+        for name in os.listdir(self.sync_dir):
+            if name.startswith(TMP_PREFIX):
+                try:
+                    os.remove(os.path.join(self.sync_dir, name))
+                except OSError as e:
+                    print(f"Ошибка при удалении временного файла '{name}': {str(e)}")
+
+    @staticmethod
+    def _fingerprint(data):
+        """Stable hash of API data, used to detect changes between polls"""
+        import hashlib
+        import json
+
+        return hashlib.sha1(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def load_sync_state(self):
+        """Load the inventory recorded by the previous sync"""
+        import json
+
+        if os.path.exists(self.sync_state_file):
+            try:
+                with open(self.sync_state_file, "r") as file:
+                    return json.load(file)
+            except Exception as e:
+                print(f"Ошибка при загрузке состояния синхронизации: {str(e)}")
+        return {"inventory": "", "lists": {}}
+
+    def save_sync_state(self, state):
+        """Save the inventory of synced lists"""
+        import json
+
+        try:
+            self._atomic_write(self.sync_state_file, json.dumps(state, indent=4))
+        except Exception as e:
+            print(f"Ошибка при сохранении состояния синхронизации: {str(e)}")
+
+    def sync_lists(self, export_type="txt"):
+        """Bring files in sync_dir in line with the lists on the account.
+
+        Only new or changed lists are downloaded, files of deleted lists are removed.
+        Returns a dict with the number of added, updated and removed lists.
+        """
+        stats = {"added": 0, "updated": 0, "removed": 0}
+
+        lists = self._fetch_lists()
+        if lists is None:
+            # Don't treat a failed request as "all lists were deleted"
+            print("Синхронизация пропущена: не удалось получить списки.")
+            return stats
+
+        state = self.load_sync_state()
+        synced = state.get("lists", {})
+        inventory = self._fingerprint(lists)
+
+        # Nothing changed since the last poll - no downloads and no writes
+        if inventory == state.get("inventory") and all(
+                os.path.exists(entry["file"]) for entry in synced.values()):
+            return stats
+
+        os.makedirs(self.sync_dir, exist_ok=True)
+        self._remove_stale_tmp_files()
+        current = {}
+        failed = False
+
+        for item in lists:
+            list_id = str(item.get('id'))
+            list_title = item.get('title', f'proxies_{list_id}')
+            countries = self._list_countries(item)
+            countries_str = "_".join(countries) if countries else 'no_country'
+            filename = os.path.join(self.sync_dir, f"{self._safe_title(list_title)}_{list_id}_{countries_str}.{export_type}")
+            fingerprint = self._fingerprint(item)
+
+            previous = synced.get(list_id)
+            if previous and previous["fingerprint"] == fingerprint and previous["file"] == filename \
+                    and os.path.exists(filename):
+                current[list_id] = previous
+                continue
+
+            content = self._download_list(item.get('id'), export_type)
+            written = False
+            if content is not None:
+                try:
+                    with self._phase("write"):
+                        self._atomic_write(filename, content)
+                    written = True
+                except Exception as e:
+                    print(f"Ошибка при сохранении файла '{filename}': {str(e)}")
+
+            if not written:
+                # Keep the old entry but invalidate it, so the list is retried on the next poll
+                failed = True
+                if previous:
+                    current[list_id] = dict(previous, fingerprint="")
+                continue
+
+            # The list was renamed - drop the file with the old name
+            if previous and previous["file"] != filename and os.path.exists(previous["file"]):
+                os.remove(previous["file"])
+
+            current[list_id] = {"title": list_title, "file": filename, "fingerprint": fingerprint}
+            if previous:
+                stats["updated"] += 1
+                print(f"Обновлен список '{list_title}' -> '{filename}'.")
+            else:
+                stats["added"] += 1
+                print(f"Добавлен список '{list_title}' -> '{filename}'.")
+
+        for list_id, entry in synced.items():
+            if list_id not in current:
+                if os.path.exists(entry["file"]):
+                    os.remove(entry["file"])
+                stats["removed"] += 1
+                print(f"Удален файл списка '{entry.get('title', list_id)}'.")
+
+        # Force a full pass on the next poll if some lists could not be synced
+        if failed:
+            inventory = ""
+
+        self.save_sync_state({"inventory": inventory, "lists": current})
+        return stats
+
+    def _download_list(self, list_id, export_type="txt"):
+        """Download the proxies of a single list, returning None on failure"""
+        import requests
+
+        url = f'https://proxy-seller.com/personal/api/v1/{self.api_key}/proxy/download/resident'
+        params = {
+            'format': export_type,
+            'listId': list_id
+        }
+
+        try:
+            with self._phase("fetch"):
+                response = requests.get(url, params=params)
+
+            if response.status_code == 200:
+                return response.text
+
+            print(f'Ошибка при загрузке прокси из списка {list_id}. Код ошибки: {response.status_code}')
+            print('Ответ сервера:', response.text)
+        except Exception as e:
+            print(f"Произошла ошибка при загрузке прокси из списка {list_id}: {str(e)}")
+
+        return None
+
+    def watch_lists(self, interval=60, export_type="txt"):
+        """Poll the account and keep sync_dir up to date until interrupted"""
+        interval = max(interval, 1)
+        print(f"\nСинхронизация списков в папку '{self.sync_dir}' каждые {interval} сек. Ctrl+C для остановки.")
+
+        try:
+            while True:
+                # A failed poll (file system error, corrupted sync state) must not stop the daemon
+                try:
+                    stats = self.sync_lists(export_type)
+                    if any(stats.values()):
+                        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Добавлено: {stats['added']}, "
+                              f"обновлено: {stats['updated']}, удалено: {stats['removed']}")
+                except Exception as e:
+                    print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Ошибка синхронизации: {str(e)}")
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("\nСинхронизация остановлена.")
+
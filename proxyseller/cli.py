@@ -0,0 +1,110 @@
+"""Interactive command-line interface for ProxySeller API Manager."""
+import os
+
+from .api import ProxySellerAPI
+
+PROFILE_ENV = "PROXYSELLER_PROFILE"
+
+
+def display_menu():
+    """Display the main menu"""
+    print("\n" + "=" * 50)
+    print("       ProxySeller API Manager")
+    print("=" * 50)
+    print("1. Получить существующие списки IP")
+    print("2. Скачать прокси из существующего списка")
+    print("3. Создать новый список (или несколько)")
+    print("4. Переименовать список")
+    print("5. Удалить списки")
+    print("6. Синхронизировать списки (режим наблюдения)")
+    print("7. Массовое переименование списков")
+    print("0. Выход")
+    print("=" * 50)
+    return input("Выберите опцию: ")
+
+
+def positive_int(value):
+    """argparse type for a strictly positive integer"""
+    import argparse
+
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: '{value}'")
+    return number
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ProxySeller API Manager")
+    parser.add_argument("--watch", type=positive_int, metavar="SECONDS",
+                        help="run as a daemon, syncing proxy files every SECONDS")
+    parser.add_argument("--profile", metavar="DIR", default=os.environ.get(PROFILE_ENV),
+                        help="profile the run and write a report, pstats and folded stacks to DIR "
+                             f"(also enabled by {PROFILE_ENV})")
+    args = parser.parse_args(argv)
+
+    if not args.profile:
+        run(args)
+        return
+
+    from .profiling import Profiler
+
+    with Profiler(args.profile) as profiler:
+        run(args, profiler)
+
+
+def run(args, profiler=None):
+    proxy_api = ProxySellerAPI(interactive=True, profiler=profiler)
+    # Ask for a missing API key at startup rather than in the middle of a menu action
+    proxy_api.resolve_api_key()
+
+    if args.watch is not None:
+        proxy_api.watch_lists(args.watch)
+        return
+
+    while True:
+        choice = display_menu()
+
+        if choice == "1":
+            lists = proxy_api.get_lists()
+            proxy_api.display_lists(lists)
+            input("\nНажмите Enter для продолжения...")
+
+        elif choice == "2":
+            proxy_api.download_proxies()
+            input("\nНажмите Enter для продолжения...")
+
+        elif choice == "3":
+            proxy_api.create_lists()
+            input("\nНажмите Enter для продолжения...")
+
+        elif choice == "4":
+            proxy_api.rename_list()
+            input("\nНажмите Enter для продолжения...")
+
+        elif choice == "5":
+            proxy_api.delete_list()
+            input("\nНажмите Enter для продолжения...")
+
+        elif choice == "6":
+            try:
+                interval = int(input("Интервал опроса в секундах [60]: ") or "60")
+            except ValueError:
+                interval = 60
+                print("Ошибка ввода. Установлено значение по умолчанию: 60 секунд.")
+            proxy_api.watch_lists(max(interval, 1))
+
+        elif choice == "7":
+            proxy_api.bulk_rename_lists()
+            input("\nНажмите Enter для продолжения...")
+
+        elif choice == "0":
+            print("\nВыход из программы...")
+            break
+
+        else:
+            print("\nНеверный выбор. Пожалуйста, попробуйте снова.")
@@ -0,0 +1,195 @@
+"""Profiling for end-to-end runs.
+
+``Profiler`` wraps a run with cProfile, tracemalloc and a stack sampler, and keeps
+per-phase timers (fetch, parse, format, write) that ``ProxySellerAPI`` reports into.
+On stop it writes to ``output_dir``:
+
+- ``report.txt``     phase timings, peak memory, top functions and allocation sites
+- ``profile.pstats`` raw cProfile data (``python -m pstats``, snakeviz, ...)
+- ``stacks.folded``  sampled stacks in collapsed format for flamegraph.pl or speedscope
+
+Phases are tracked per thread, so worker threads (e.g. in ``bulk_rename``) are
+labelled with their own phase. cProfile covers threads started after ``start()``
+as well; on Python < 3.12 each new thread gets its own profile, merged on report.
+tracemalloc is process-wide, so when phases overlap across threads their peak
+memory is the peak since the first of them started.
+
+The heavy modules are only imported when profiling actually starts.
+"""
+import os
+import sys
+import threading
+import time
+
+PHASES = ("fetch", "parse", "format", "write")
+
+
+class _Phase:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._enter_phase(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler._exit_phase(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    def __init__(self, output_dir="profile", sample_interval=0.005, trace_frames=25):
+        self.output_dir = output_dir
+        self.sample_interval = sample_interval
+        self.trace_frames = trace_frames
+        self.phases = {}
+        self.samples = {}
+        self._active = {}
+        self._lock = threading.Lock()
+        self._profile = None
+        self._thread_profiles = []
+        self._sampler = None
+        self._stop_sampling = None
+        self._snapshot = None
+        self._peak_memory = 0
+        self._started = None
+        self._elapsed = 0.0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        self.write_report()
+        return False
+
+    def phase(self, name):
+        """Context manager that attributes the enclosed time and peak memory to ``name``"""
+        return _Phase(self, name)
+
+    def start(self):
+        import cProfile
+        import tracemalloc
+
+        self._stop_sampling = threading.Event()
+        tracemalloc.start(self.trace_frames)
+        self._sampler = threading.Thread(target=self._sample, name="profiler-sampler", daemon=True)
+        self._sampler.start()
+        # Before 3.12 cProfile only sees the thread that enabled it
+        if sys.version_info < (3, 12):
+            threading.setprofile(self._profile_thread)
+        self._profile = cProfile.Profile()
+        self._started = time.perf_counter()
+        self._profile.enable()
+
+    def stop(self):
+        import tracemalloc
+
+        self._profile.disable()
+        threading.setprofile(None)
+        self._elapsed = time.perf_counter() - self._started
+        self._stop_sampling.set()
+        self._sampler.join()
+        self._peak_memory = max(self._peak_memory, tracemalloc.get_traced_memory()[1])
+        self._snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    def _profile_thread(self, frame, event, arg):
+        """Profile hook run once in each new thread: hand the thread over to its own cProfile"""
+        import cProfile
+
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        with self._lock:
+            self._thread_profiles.append(profile)
+        profile.enable()
+
+    def _enter_phase(self, name):
+        import tracemalloc
+
+        with self._lock:
+            # The peak is process-wide, so only reset it when no phase is running in any thread
+            if not any(self._active.values()) and tracemalloc.is_tracing():
+                self._peak_memory = max(self._peak_memory, tracemalloc.get_traced_memory()[1])
+                tracemalloc.reset_peak()
+            self._active.setdefault(threading.get_ident(), []).append(name)
+
+    def _exit_phase(self, name, elapsed):
+        import tracemalloc
+
+        with self._lock:
+            thread_id = threading.get_ident()
+            self._active[thread_id].remove(name)
+            if not self._active[thread_id]:
+                del self._active[thread_id]
+            peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+            stats = self.phases.setdefault(name, {"calls": 0, "seconds": 0.0, "peak_memory": 0})
+            stats["calls"] += 1
+            stats["seconds"] += elapsed
+            stats["peak_memory"] = max(stats["peak_memory"], peak)
+
+    def _sample(self):
+        """Record the stack of every thread at a fixed interval"""
+        own_id = self._sampler.ident
+        while not self._stop_sampling.wait(self.sample_interval):
+            # Snapshot under the lock, workers add and remove phases concurrently
+            with self._lock:
+                current_phases = {thread_id: phases[-1] for thread_id, phases in self._active.items() if phases}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                phase = current_phases.get(thread_id, "other")
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(f"phase:{phase}")
+                key = ";".join(reversed(stack))
+                self.samples[key] = self.samples.get(key, 0) + 1
+
+    def write_report(self):
+        """Write report.txt, profile.pstats and stacks.folded to output_dir"""
+        import io
+        import pstats
+
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        out = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=out)
+        for profile in self._thread_profiles:
+            stats.add(profile)
+        stats.dump_stats(os.path.join(self.output_dir, "profile.pstats"))
+
+        with open(os.path.join(self.output_dir, "stacks.folded"), "w") as file:
+            for stack, count in sorted(self.samples.items()):
+                file.write(f"{stack} {count}\n")
+
+        out.write(f"Wall time: {self._elapsed:.3f} s\n")
+        out.write(f"Peak traced memory: {self._peak_memory / 1024 / 1024:.2f} MiB\n\n")
+
+        out.write("Phases (time is summed across threads):\n")
+        out.write(f"{'phase':<10} {'calls':>7} {'seconds':>10} {'peak MiB':>10}\n")
+        for name in list(PHASES) + sorted(set(self.phases) - set(PHASES)):
+            phase_stats = self.phases.get(name)
+            if phase_stats:
+                out.write(f"{name:<10} {phase_stats['calls']:>7} {phase_stats['seconds']:>10.3f} "
+                          f"{phase_stats['peak_memory'] / 1024 / 1024:>10.2f}\n")
+
+        out.write("\nProxySellerAPI functions by cumulative time (all threads):\n")
+        stats.sort_stats("cumulative").print_stats("proxyseller", 30)
+
+        out.write("\nAll functions by internal time:\n")
+        stats.sort_stats("tottime").print_stats(30)
+
+        out.write("\nTop allocation sites:\n")
+        for stat in self._snapshot.statistics("lineno")[:15]:
+            out.write(f"{stat}\n")
+
+        with open(os.path.join(self.output_dir, "report.txt"), "w") as file:
+            file.write(out.getvalue())
+
+        print(f"\nОтчет профилирования сохранен в папку '{self.output_dir}'.")